@@ -18,9 +18,9 @@ import (
 	"strconv"
 	"strings"
 	"sync"
+	"sync/atomic"
 	"syscall"
 	"time"
-	"unicode"
 	"unicode/utf16"
 	"unicode/utf8"
 
@@ -31,6 +31,7 @@ import (
 type Config struct {
 	ControllerURL        string
 	ControllerSecret     string
+	AuthHeader           string
 	ProxyGroup           string
 	TestURL              string
 	DelayTimeoutMS       int
@@ -47,6 +48,11 @@ type ProxyDelay struct {
 	DelayMS int
 }
 
+type delayOutput struct {
+	Name    string `json:"name"`
+	DelayMS int    `json:"delay_ms"`
+}
+
 type EndpointResult struct {
 	URL       string `json:"url"`
 	Reachable bool   `json:"reachable"`
@@ -58,10 +64,10 @@ var hkTokenRE = regexp.MustCompile(`(?i)(^|[^a-z0-9])hk([^a-z0-9]|$)`)
 const endpointProbeCandidateLimit = 10
 
 func isExcludedProxy(name string) bool {
-	lowered := strings.ToLower(name)
 	if strings.Contains(name, "香港") {
 		return true
 	}
+	lowered := strings.ToLower(name)
 	if strings.Contains(lowered, "hong kong") {
 		return true
 	}
@@ -153,6 +159,12 @@ func loadConfig() (Config, error) {
 		return Config{}, errors.New("KEEP_DELAY_THRESHOLD_MS must be >= 0")
 	}
 
+	controllerSecret := strings.TrimSpace(os.Getenv("MIHOMO_CONTROLLER_SECRET"))
+	authHeader := ""
+	if controllerSecret != "" {
+		authHeader = "Bearer " + controllerSecret
+	}
+
 	proxyAddr := strings.TrimSpace(os.Getenv("MIHOMO_PROXY_ADDR"))
 	if len(endpointURLs) > 0 && proxyAddr == "" {
 		log.Printf("Warning: ENDPOINT_URLS is set but MIHOMO_PROXY_ADDR is empty; endpoint checks are disabled")
@@ -160,7 +172,8 @@ func loadConfig() (Config, error) {
 
 	return Config{
 		ControllerURL:        strings.TrimRight(controllerURL, "/"),
-		ControllerSecret:     strings.TrimSpace(os.Getenv("MIHOMO_CONTROLLER_SECRET")),
+		ControllerSecret:     controllerSecret,
+		AuthHeader:           authHeader,
 		ProxyGroup:           envOrDefault("MIHOMO_PROXY_GROUP", "GLOBAL"),
 		TestURL:              envOrDefault("TEST_URL", "https://google.com"),
 		DelayTimeoutMS:       delayTimeoutMS,
@@ -173,14 +186,16 @@ func loadConfig() (Config, error) {
 	}, nil
 }
 
-func setAuthHeader(req *http.Request, secret string) {
-	if secret != "" {
-		req.Header.Set("Authorization", "Bearer "+secret)
-	}
-}
-
 func toInt(value any) (int, bool) {
 	switch v := value.(type) {
+	case json.Number:
+		// The controller decoders run with UseNumber, so delay values hit
+		// this case on every parse loop iteration; test it first.
+		i, err := v.Int64()
+		if err != nil {
+			return 0, false
+		}
+		return int(i), true
 	case int:
 		return v, true
 	case int32:
@@ -189,12 +204,6 @@ func toInt(value any) (int, bool) {
 		return int(v), true
 	case float64:
 		return int(v), true
-	case json.Number:
-		i, err := v.Int64()
-		if err != nil {
-			return 0, false
-		}
-		return int(i), true
 	case string:
 		i, err := strconv.Atoi(v)
 		if err != nil {
@@ -206,26 +215,77 @@ func toInt(value any) (int, bool) {
 	}
 }
 
+type delayPayloadShape int32
+
+const (
+	shapeUnknown delayPayloadShape = iota
+	shapeDelaysField
+	shapeFlatMap
+	shapeProxiesList
+	shapeSingle
+)
+
+// The controller returns the same payload shape for the life of the process,
+// so remember which branch matched last and try it first on later calls
+// instead of re-running the full shape detection every tick.
+var lastDelayShape atomic.Int32
+
 func parseGroupDelays(payload map[string]any, filterHKNodes bool) []ProxyDelay {
-	delays := make([]ProxyDelay, 0)
+	if shape := delayPayloadShape(lastDelayShape.Load()); shape != shapeUnknown {
+		if delays, ok := parseDelayShape(payload, filterHKNodes, shape); ok {
+			return delays
+		}
+	}
+	return detectAndParseDelays(payload, filterHKNodes)
+}
 
-	if delaysRaw, ok := payload["delays"].(map[string]any); ok {
-		for name, delay := range delaysRaw {
-			if filterHKNodes && isExcludedProxy(name) {
-				continue
-			}
-			delayMS, ok := toInt(delay)
-			if !ok {
-				continue
-			}
-			if delayMS >= 0 {
-				delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
-			}
+func parseDelayShape(payload map[string]any, filterHKNodes bool, shape delayPayloadShape) ([]ProxyDelay, bool) {
+	switch shape {
+	case shapeDelaysField:
+		return parseDelaysField(payload, filterHKNodes)
+	case shapeFlatMap:
+		return parseFlatMap(payload, filterHKNodes)
+	case shapeProxiesList:
+		return parseProxiesList(payload, filterHKNodes)
+	case shapeSingle:
+		return parseSingle(payload, filterHKNodes)
+	}
+	return nil, false
+}
+
+func detectAndParseDelays(payload map[string]any, filterHKNodes bool) []ProxyDelay {
+	if delays, ok := parseDelaysField(payload, filterHKNodes); ok {
+		lastDelayShape.Store(int32(shapeDelaysField))
+		return delays
+	}
+	// A payload carrying a "proxies" list is not a flat name->delay map, so
+	// skip the full-map walk and go straight to the list parser.
+	if _, hasProxies := payload["proxies"]; !hasProxies {
+		if delays, ok := parseFlatMap(payload, filterHKNodes); ok {
+			lastDelayShape.Store(int32(shapeFlatMap))
+			return delays
 		}
+	}
+	if delays, ok := parseProxiesList(payload, filterHKNodes); ok {
+		lastDelayShape.Store(int32(shapeProxiesList))
+		return delays
+	}
+	if delays, ok := parseSingle(payload, filterHKNodes); ok {
+		lastDelayShape.Store(int32(shapeSingle))
 		return delays
 	}
 
-	for name, delay := range payload {
+	log.Printf("Unexpected delay payload shape: %v", payload)
+	return []ProxyDelay{}
+}
+
+func parseDelaysField(payload map[string]any, filterHKNodes bool) ([]ProxyDelay, bool) {
+	delaysRaw, ok := payload["delays"].(map[string]any)
+	if !ok {
+		return nil, false
+	}
+	delays := make([]ProxyDelay, 0, len(delaysRaw))
+	for name, delay := range delaysRaw {
 		if filterHKNodes && isExcludedProxy(name) {
 			continue
 		}
@@ -237,51 +297,72 @@ func parseGroupDelays(payload map[string]any, filterHKNodes bool) []ProxyDelay {
 			delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
 		}
 	}
-	if len(delays) > 0 {
-		return delays
-	}
+	return delays, true
+}
 
-	if proxiesRaw, ok := payload["proxies"].([]any); ok {
-		for _, item := range proxiesRaw {
-			proxyItem, ok := item.(map[string]any)
-			if !ok {
-				continue
-			}
-			name, ok := proxyItem["name"].(string)
-			if !ok {
-				continue
-			}
-			if filterHKNodes && isExcludedProxy(name) {
-				continue
-			}
-			delayMS, ok := toInt(proxyItem["delay"])
-			if !ok {
-				continue
-			}
-			if delayMS >= 0 {
-				delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
-			}
+func parseFlatMap(payload map[string]any, filterHKNodes bool) ([]ProxyDelay, bool) {
+	delays := make([]ProxyDelay, 0, len(payload))
+	for name, delay := range payload {
+		if filterHKNodes && isExcludedProxy(name) {
+			continue
+		}
+		delayMS, ok := toInt(delay)
+		if !ok {
+			continue
+		}
+		if delayMS >= 0 {
+			delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
 		}
-		return delays
 	}
+	return delays, len(delays) > 0
+}
 
-	name, hasName := payload["name"].(string)
-	delay, hasDelay := payload["delay"]
-	if hasName && hasDelay {
+func parseProxiesList(payload map[string]any, filterHKNodes bool) ([]ProxyDelay, bool) {
+	proxiesRaw, ok := payload["proxies"].([]any)
+	if !ok {
+		return nil, false
+	}
+	delays := make([]ProxyDelay, 0, len(proxiesRaw))
+	for _, item := range proxiesRaw {
+		proxyItem, ok := item.(map[string]any)
+		if !ok {
+			continue
+		}
+		name, ok := proxyItem["name"].(string)
+		if !ok {
+			continue
+		}
 		if filterHKNodes && isExcludedProxy(name) {
-			return []ProxyDelay{}
+			continue
 		}
-		delayMS, ok := toInt(delay)
-		if ok && delayMS >= 0 {
-			return []ProxyDelay{{Name: name, DelayMS: delayMS}}
+		delayMS, ok := toInt(proxyItem["delay"])
+		if !ok {
+			continue
+		}
+		if delayMS >= 0 {
+			delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
 		}
 	}
+	return delays, true
+}
 
-	log.Printf("Unexpected delay payload shape: %v", payload)
-	return []ProxyDelay{}
+func parseSingle(payload map[string]any, filterHKNodes bool) ([]ProxyDelay, bool) {
+	name, hasName := payload["name"].(string)
+	delay, hasDelay := payload["delay"]
+	if !hasName || !hasDelay {
+		return nil, false
+	}
+	if filterHKNodes && isExcludedProxy(name) {
+		return []ProxyDelay{}, true
+	}
+	delayMS, ok := toInt(delay)
+	if !ok || delayMS < 0 {
+		return nil, false
+	}
+	return []ProxyDelay{{Name: name, DelayMS: delayMS}}, true
 }
 
-func controllerRequest(client *http.Client, cfg Config, method, endpoint string, body []byte) (map[string]any, error) {
+func controllerRequestBytes(client *http.Client, cfg Config, method, endpoint string, body []byte) ([]byte, error) {
 	var reader *bytes.Reader
 	if body == nil {
 		reader = bytes.NewReader([]byte{})
@@ -292,7 +373,9 @@ func controllerRequest(client *http.Client, cfg Config, method, endpoint string,
 	if err != nil {
 		return nil, err
 	}
-	setAuthHeader(req, cfg.ControllerSecret)
+	if cfg.AuthHeader != "" {
+		req.Header.Set("Authorization", cfg.AuthHeader)
+	}
 	if body != nil {
 		req.Header.Set("Content-Type", "application/json")
 	}
@@ -305,10 +388,17 @@ func controllerRequest(client *http.Client, cfg Config, method, endpoint string,
 		return nil, fmt.Errorf("request failed: %s", resp.Status)
 	}
 	if resp.StatusCode == http.StatusNoContent || resp.ContentLength == 0 {
+		return nil, nil
+	}
+	return io.ReadAll(resp.Body)
+}
+
+func decodeJSONObject(raw []byte) (map[string]any, error) {
+	if len(raw) == 0 {
 		return map[string]any{}, nil
 	}
 	var payload map[string]any
-	decoder := json.NewDecoder(resp.Body)
+	decoder := json.NewDecoder(bytes.NewReader(raw))
 	decoder.UseNumber()
 	if err := decoder.Decode(&payload); err != nil {
 		if errors.Is(err, io.EOF) {
@@ -319,6 +409,74 @@ func controllerRequest(client *http.Client, cfg Config, method, endpoint string,
 	return payload, nil
 }
 
+func controllerRequest(client *http.Client, cfg Config, method, endpoint string, body []byte) (map[string]any, error) {
+	raw, err := controllerRequestBytes(client, cfg, method, endpoint, body)
+	if err != nil {
+		return nil, err
+	}
+	return decodeJSONObject(raw)
+}
+
+// streamParseGroupDelays decodes the common {"delays": {...}} payload shape
+// token by token, emitting ProxyDelay entries during decode instead of first
+// materializing the whole payload as a generic map. It reports false when the
+// payload does not match that shape so the caller can fall back to
+// parseGroupDelays.
+func streamParseGroupDelays(raw []byte, filterHKNodes bool) ([]ProxyDelay, bool) {
+	decoder := json.NewDecoder(bytes.NewReader(raw))
+	decoder.UseNumber()
+	tok, err := decoder.Token()
+	if err != nil || tok != json.Delim('{') {
+		return nil, false
+	}
+	for decoder.More() {
+		keyTok, err := decoder.Token()
+		if err != nil {
+			return nil, false
+		}
+		key, ok := keyTok.(string)
+		if !ok {
+			return nil, false
+		}
+		if key != "delays" {
+			var skip json.RawMessage
+			if err := decoder.Decode(&skip); err != nil {
+				return nil, false
+			}
+			continue
+		}
+		tok, err := decoder.Token()
+		if err != nil || tok != json.Delim('{') {
+			return nil, false
+		}
+		delays := make([]ProxyDelay, 0, 64)
+		for decoder.More() {
+			nameTok, err := decoder.Token()
+			if err != nil {
+				return nil, false
+			}
+			name, ok := nameTok.(string)
+			if !ok {
+				return nil, false
+			}
+			var value any
+			if err := decoder.Decode(&value); err != nil {
+				return nil, false
+			}
+			if filterHKNodes && isExcludedProxy(name) {
+				continue
+			}
+			delayMS, ok := toInt(value)
+			if !ok || delayMS < 0 {
+				continue
+			}
+			delays = append(delays, ProxyDelay{Name: name, DelayMS: delayMS})
+		}
+		return delays, true
+	}
+	return nil, false
+}
+
 func getGroupDelaysWithFilter(client *http.Client, cfg Config, filterHKNodes bool) []ProxyDelay {
 	endpoint := fmt.Sprintf("%s/group/%s/delay", cfg.ControllerURL, url.PathEscape(cfg.ProxyGroup))
 	params := url.Values{}
@@ -326,7 +484,15 @@ func getGroupDelaysWithFilter(client *http.Client, cfg Config, filterHKNodes boo
 	params.Set("timeout", strconv.Itoa(cfg.DelayTimeoutMS))
 	endpoint = endpoint + "?" + params.Encode()
 
-	payload, err := controllerRequest(client, cfg, http.MethodGet, endpoint, nil)
+	raw, err := controllerRequestBytes(client, cfg, http.MethodGet, endpoint, nil)
+	if err != nil {
+		log.Printf("Group delay check failed: %v", err)
+		return []ProxyDelay{}
+	}
+	if delays, ok := streamParseGroupDelays(raw, filterHKNodes); ok {
+		return delays
+	}
+	payload, err := decodeJSONObject(raw)
 	if err != nil {
 		log.Printf("Group delay check failed: %v", err)
 		return []ProxyDelay{}
@@ -338,6 +504,15 @@ func getGroupDelays(client *http.Client, cfg Config) []ProxyDelay {
 	return getGroupDelaysWithFilter(client, cfg, cfg.FilterHKNodes)
 }
 
+func lookupDelay(delays []ProxyDelay, name string) (int, bool) {
+	for _, item := range delays {
+		if item.Name == name {
+			return item.DelayMS, true
+		}
+	}
+	return 0, false
+}
+
 func findBestAlternative(delays []ProxyDelay, current string) (ProxyDelay, bool) {
 	for _, item := range delays {
 		if item.Name != current {
@@ -401,19 +576,35 @@ func findBestReachableAlternative(client *http.Client, cfg Config, delays []Prox
 	return ProxyDelay{}, false
 }
 
+const sanitizeCacheLimit = 2048
+
+// Strip everything except letters, numbers, combining marks, and the safe
+// punctuation set " .-_()/[]:".
+var sanitizeRE = regexp.MustCompile(`[^\p{L}\p{N}\p{M} .\-_()/\[\]:]`)
+
+var (
+	sanitizeCacheMu sync.RWMutex
+	sanitizeCache   = make(map[string]string)
+)
+
 func sanitizeName(name string) string {
-	const safePunct = " .-_()/[]:"
-	var b strings.Builder
-	for _, r := range name {
-		if strings.ContainsRune(safePunct, r) {
-			b.WriteRune(r)
-			continue
-		}
-		if unicode.IsLetter(r) || unicode.IsNumber(r) || unicode.IsMark(r) {
-			b.WriteRune(r)
-		}
-	}
-	return strings.TrimSpace(b.String())
+	// The same proxy-name set recurs on every monitor tick, so cache the
+	// sanitized form instead of re-walking the runes each time. The cache
+	// is reset if it ever grows past the limit to keep it bounded.
+	sanitizeCacheMu.RLock()
+	cached, ok := sanitizeCache[name]
+	sanitizeCacheMu.RUnlock()
+	if ok {
+		return cached
+	}
+	cleaned := strings.TrimSpace(sanitizeRE.ReplaceAllString(name, ""))
+	sanitizeCacheMu.Lock()
+	if len(sanitizeCache) >= sanitizeCacheLimit {
+		sanitizeCache = make(map[string]string, sanitizeCacheLimit)
+	}
+	sanitizeCache[name] = cleaned
+	sanitizeCacheMu.Unlock()
+	return cleaned
 }
 
 func getCurrentProxy(client *http.Client, cfg Config) (string, bool) {
@@ -432,7 +623,9 @@ func getCurrentProxy(client *http.Client, cfg Config) (string, bool) {
 
 func switchProxy(client *http.Client, cfg Config, candidate ProxyDelay) error {
 	endpoint := fmt.Sprintf("%s/proxies/%s", cfg.ControllerURL, url.PathEscape(cfg.ProxyGroup))
-	body, err := json.Marshal(map[string]string{"name": candidate.Name})
+	body, err := json.Marshal(struct {
+		Name string `json:"name"`
+	}{Name: candidate.Name})
 	if err != nil {
 		return err
 	}
@@ -485,12 +678,51 @@ func buildBaseTransportNoEnvProxy() (*http.Transport, error) {
 	return transport, nil
 }
 
-func checkEndpoint(proxyAddr, targetURL string, timeout time.Duration) EndpointResult {
+func buildControllerClient(cfg Config) (*http.Client, error) {
+	transport, err := buildBaseTransportNoEnvProxy()
+	if err != nil {
+		return nil, err
+	}
+	// The monitor loop talks to a single controller host forever; keep the
+	// connection alive across ticks so each request reuses one TCP session
+	// instead of paying a fresh handshake.
+	transport.MaxIdleConns = 16
+	transport.MaxIdleConnsPerHost = 8
+	transport.IdleConnTimeout = 75 * time.Second
+	timeout := time.Duration(cfg.DelayTimeoutMS)*time.Millisecond + 5*time.Second
+	return &http.Client{Transport: transport, Timeout: timeout}, nil
+}
+
+var (
+	endpointClientMu   sync.Mutex
+	endpointClientAddr string
+	endpointClient     *http.Client
+)
+
+// clientForProxyAddr returns a shared HTTP client for endpoint checks through
+// the given proxy. Building a transport per probe meant every check paid a
+// fresh connection; reusing one client keeps proxied connections alive across
+// monitor ticks. The cached client is rebuilt if the proxy address changes.
+func clientForProxyAddr(proxyAddr string, timeout time.Duration) (*http.Client, error) {
+	endpointClientMu.Lock()
+	defer endpointClientMu.Unlock()
+	if endpointClient != nil && endpointClientAddr == proxyAddr {
+		return endpointClient, nil
+	}
 	transport, err := buildTransportForProxy(proxyAddr)
+	if err != nil {
+		return nil, err
+	}
+	endpointClient = &http.Client{Transport: transport, Timeout: timeout}
+	endpointClientAddr = proxyAddr
+	return endpointClient, nil
+}
+
+func checkEndpoint(proxyAddr, targetURL string, timeout time.Duration) EndpointResult {
+	client, err := clientForProxyAddr(proxyAddr, timeout)
 	if err != nil {
 		return EndpointResult{URL: targetURL, Reachable: false, LatencyMS: -1}
 	}
-	client := &http.Client{Transport: transport, Timeout: timeout}
 	req, err := http.NewRequest(http.MethodHead, targetURL, nil)
 	if err != nil {
 		return EndpointResult{URL: targetURL, Reachable: false, LatencyMS: -1}
@@ -524,15 +756,17 @@ func checkAllEndpoints(proxyAddr string, urls []string) []EndpointResult {
 	return results
 }
 
-func mustASCIIJSON(v any) string {
+func printASCIIJSON(v any) {
 	raw, err := json.Marshal(v)
 	if err != nil {
-		return "{}"
+		fmt.Println("{}")
+		return
 	}
-	return escapeNonASCII(raw)
+	buf := append(escapeNonASCII(raw), '\n')
+	_, _ = os.Stdout.Write(buf)
 }
 
-func escapeNonASCII(raw []byte) string {
+func escapeNonASCII(raw []byte) []byte {
 	buf := make([]byte, 0, len(raw)+16)
 	for i := 0; i < len(raw); {
 		if raw[i] < utf8.RuneSelf {
@@ -549,22 +783,29 @@ func escapeNonASCII(raw []byte) string {
 		buf = appendEscapedRune(buf, r)
 		i += size
 	}
-	return string(buf)
+	return buf
+}
+
+const hexDigits = "0123456789abcdef"
+
+func appendEscapedUnit(dst []byte, u uint16) []byte {
+	return append(dst, '\\', 'u',
+		hexDigits[u>>12&0xf], hexDigits[u>>8&0xf], hexDigits[u>>4&0xf], hexDigits[u&0xf])
 }
 
 func appendEscapedRune(dst []byte, r rune) []byte {
 	if r <= 0xFFFF {
-		return append(dst, []byte(fmt.Sprintf("\\u%04x", r))...)
+		return appendEscapedUnit(dst, uint16(r))
 	}
 	for _, part := range utf16.Encode([]rune{r}) {
-		dst = append(dst, []byte(fmt.Sprintf("\\u%04x", part))...)
+		dst = appendEscapedUnit(dst, part)
 	}
 	return dst
 }
 
 func printDelaysOnce(client *http.Client, cfg Config, jsonOutput bool) {
 	delays := getGroupDelays(client, cfg)
-	sortDelays(delays)
+	sortTopDelays(delays, 10)
 	if len(delays) > 10 {
 		delays = delays[:10]
 	}
@@ -579,11 +820,11 @@ func printDelaysOnce(client *http.Client, cfg Config, jsonOutput bool) {
 	}
 
 	if jsonOutput {
-		payload := make([]map[string]any, 0, len(delays))
+		payload := make([]delayOutput, 0, len(delays))
 		for _, item := range delays {
-			payload = append(payload, map[string]any{"name": item.Name, "delay_ms": item.DelayMS})
+			payload = append(payload, delayOutput{Name: item.Name, DelayMS: item.DelayMS})
 		}
-		fmt.Println(mustASCIIJSON(payload))
+		printASCIIJSON(payload)
 		return
 	}
 
@@ -592,37 +833,55 @@ func printDelaysOnce(client *http.Client, cfg Config, jsonOutput bool) {
 	}
 }
 
-func sortDelays(delays []ProxyDelay) {
-	for i := 1; i < len(delays); i++ {
-		j := i
-		for j > 0 && delays[j-1].DelayMS > delays[j].DelayMS {
-			delays[j-1], delays[j] = delays[j], delays[j-1]
-			j--
+// sortTopDelays moves the k fastest proxies to the front of the slice in
+// ascending delay order and leaves the remainder unordered. Callers only ever
+// consume a short sorted prefix (top-10 display, alternative probing), so
+// selecting k entries is O(N*k) instead of sorting the whole group.
+func sortTopDelays(delays []ProxyDelay, k int) {
+	if k > len(delays) {
+		k = len(delays)
+	}
+	for i := 0; i < k; i++ {
+		minIdx := i
+		for j := i + 1; j < len(delays); j++ {
+			if delays[j].DelayMS < delays[minIdx].DelayMS {
+				minIdx = j
+			}
 		}
+		delays[i], delays[minIdx] = delays[minIdx], delays[i]
 	}
 }
 
 func printCurrentDelayOnce(client *http.Client, cfg Config, jsonOutput bool) {
-	current, ok := getCurrentProxy(client, cfg)
+	var (
+		current string
+		ok      bool
+		delays  []ProxyDelay
+	)
+	var wg sync.WaitGroup
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		current, ok = getCurrentProxy(client, cfg)
+	}()
+	go func() {
+		defer wg.Done()
+		delays = getGroupDelaysWithFilter(client, cfg, false)
+	}()
+	wg.Wait()
+
 	if !ok {
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(map[string]any{"error": "current proxy not found"}))
+			printASCIIJSON(map[string]any{"error": "current proxy not found"})
 		} else {
 			fmt.Println("Current proxy not found")
 		}
 		return
 	}
-
-	delays := getGroupDelaysWithFilter(client, cfg, false)
-	delayMap := make(map[string]int, len(delays))
-	for _, item := range delays {
-		delayMap[item.Name] = item.DelayMS
-	}
-
-	delayMS, exists := delayMap[current]
+	delayMS, exists := lookupDelay(delays, current)
 	if !exists {
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(map[string]any{"name": current, "delay_ms": nil}))
+			printASCIIJSON(map[string]any{"name": current, "delay_ms": nil})
 		} else {
 			fmt.Printf("delay unavailable\t%s\n", sanitizeName(current))
 		}
@@ -630,19 +889,63 @@ func printCurrentDelayOnce(client *http.Client, cfg Config, jsonOutput bool) {
 	}
 
 	if jsonOutput {
-		fmt.Println(mustASCIIJSON(map[string]any{"name": current, "delay_ms": delayMS}))
+		printASCIIJSON(map[string]any{"name": current, "delay_ms": delayMS})
 		return
 	}
 	fmt.Printf("%dms\t%s\n", delayMS, sanitizeName(current))
 }
 
+// currentProxyRefreshTicks is how many monitor ticks may trust the cached
+// current-proxy name before re-asking the controller who "now" is.
+const currentProxyRefreshTicks = 10
+
+// monitorState carries the monitor loop's knowledge between ticks. The proxy
+// we last switched to (or last observed) is the current one unless something
+// external changed it, so most ticks can skip the current-proxy round trip.
+type monitorState struct {
+	lastKnownCurrent string
+	ticksSinceVerify int
+}
+
 func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
-	current, currentFound := getCurrentProxy(client, cfg)
-	delays := getGroupDelays(client, cfg)
-	sortDelays(delays)
+	autoSelectTick(client, cfg, jsonOutput, dryRun, nil)
+}
+
+func autoSelectTick(client *http.Client, cfg Config, jsonOutput, dryRun bool, state *monitorState) {
+	var (
+		current      string
+		currentFound bool
+		delays       []ProxyDelay
+	)
+	if state != nil && state.lastKnownCurrent != "" && state.ticksSinceVerify < currentProxyRefreshTicks {
+		current = state.lastKnownCurrent
+		currentFound = true
+		state.ticksSinceVerify++
+		delays = getGroupDelays(client, cfg)
+	} else {
+		var wg sync.WaitGroup
+		wg.Add(2)
+		go func() {
+			defer wg.Done()
+			current, currentFound = getCurrentProxy(client, cfg)
+		}()
+		go func() {
+			defer wg.Done()
+			delays = getGroupDelays(client, cfg)
+		}()
+		wg.Wait()
+		if state != nil {
+			state.lastKnownCurrent = ""
+			if currentFound {
+				state.lastKnownCurrent = current
+			}
+			state.ticksSinceVerify = 0
+		}
+	}
+	sortTopDelays(delays, endpointProbeCandidateLimit+1)
 	if len(delays) == 0 && cfg.FilterHKNodes {
 		delays = getGroupDelaysWithFilter(client, cfg, false)
-		sortDelays(delays)
+		sortTopDelays(delays, endpointProbeCandidateLimit+1)
 		if len(delays) > 0 {
 			log.Printf("FILTER_HK_NODES removed all delay candidates; fallback to unfiltered delays")
 		}
@@ -650,7 +953,7 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 
 	if len(delays) == 0 {
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(map[string]any{"error": "no delay data"}))
+			printASCIIJSON(map[string]any{"error": "no delay data"})
 		} else {
 			fmt.Println("No delay data returned")
 		}
@@ -659,14 +962,10 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 
 	best := delays[0]
 	allDelays := getGroupDelaysWithFilter(client, cfg, false)
-	delayMap := make(map[string]int, len(allDelays))
-	for _, item := range allDelays {
-		delayMap[item.Name] = item.DelayMS
-	}
 
 	var currentDelay *int
 	if currentFound {
-		if d, exists := delayMap[current]; exists {
+		if d, exists := lookupDelay(allDelays, current); exists {
 			currentDelay = &d
 		}
 	}
@@ -746,15 +1045,6 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 		}
 	}
 
-	epSummary := make([]map[string]any, 0, len(endpointResults))
-	for _, item := range endpointResults {
-		epSummary = append(epSummary, map[string]any{
-			"url":        item.URL,
-			"reachable":  item.Reachable,
-			"latency_ms": item.LatencyMS,
-		})
-	}
-
 	if shouldSwitch && best.Name != current {
 		if dryRun {
 			result := map[string]any{
@@ -765,10 +1055,10 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 				"from_delay_ms": currentDelay,
 				"to_delay_ms":   best.DelayMS,
 				"reason":        reason,
-				"endpoints":     epSummary,
+				"endpoints":     endpointResults,
 			}
 			if jsonOutput {
-				fmt.Println(mustASCIIJSON(result))
+				printASCIIJSON(result)
 				return
 			}
 			fromName := sanitizeName(current)
@@ -789,10 +1079,10 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 				"to_delay_ms":   best.DelayMS,
 				"reason":        reason,
 				"error":         err.Error(),
-				"endpoints":     epSummary,
+				"endpoints":     endpointResults,
 			}
 			if jsonOutput {
-				fmt.Println(mustASCIIJSON(result))
+				printASCIIJSON(result)
 				return
 			}
 			fromName := sanitizeName(current)
@@ -804,6 +1094,9 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 			fmt.Printf("switch_failed\t%s\t%s -> %dms\t%s\t(%s) err=%v\n", fromName, currentText, best.DelayMS, toName, reason, err)
 			return
 		}
+		if state != nil {
+			state.lastKnownCurrent = best.Name
+		}
 		result := map[string]any{
 			"action":        "switched",
 			"from":          current,
@@ -811,10 +1104,10 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 			"from_delay_ms": currentDelay,
 			"to_delay_ms":   best.DelayMS,
 			"reason":        reason,
-			"endpoints":     epSummary,
+			"endpoints":     endpointResults,
 		}
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(result))
+			printASCIIJSON(result)
 			return
 		}
 		fromName := sanitizeName(current)
@@ -834,13 +1127,13 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 		"best":          best.Name,
 		"best_delay_ms": best.DelayMS,
 		"reason":        reason,
-		"endpoints":     epSummary,
+		"endpoints":     endpointResults,
 	}
 	if dryRun {
 		result["dry_run"] = true
 	}
 	if jsonOutput {
-		fmt.Println(mustASCIIJSON(result))
+		printASCIIJSON(result)
 		return
 	}
 	currentText := "nil"
@@ -850,10 +1143,13 @@ func autoSelectOnce(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 	fmt.Printf("kept\t%s\t%s\t(%s)\n", currentText, sanitizeName(current), reason)
 }
 
-func monitorLoop(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
-	sigCh := make(chan os.Signal, 1)
-	signal.Notify(sigCh, syscall.SIGINT, syscall.SIGTERM)
-	defer signal.Stop(sigCh)
+func monitorLoop(client *http.Client, cfg Config, jsonOutput, dryRun bool, sigCh <-chan os.Signal) {
+	// Schedule ticks against a monotonic deadline so the cadence stays at
+	// the configured interval instead of interval plus work time, which
+	// would drift whenever the controller responds slowly.
+	interval := time.Duration(cfg.MonitorIntervalS) * time.Second
+	nextTick := time.Now()
+	state := monitorState{}
 
 	for {
 		select {
@@ -863,9 +1159,17 @@ func monitorLoop(client *http.Client, cfg Config, jsonOutput, dryRun bool) {
 		default:
 		}
 
-		autoSelectOnce(client, cfg, jsonOutput, dryRun)
+		autoSelectTick(client, cfg, jsonOutput, dryRun, &state)
 
-		timer := time.NewTimer(time.Duration(cfg.MonitorIntervalS) * time.Second)
+		nextTick = nextTick.Add(interval)
+		wait := time.Until(nextTick)
+		if wait < 0 {
+			// The tick overran the interval; realign instead of firing a
+			// burst of catch-up ticks.
+			nextTick = time.Now()
+			wait = 0
+		}
+		timer := time.NewTimer(wait)
 		select {
 		case <-sigCh:
 			timer.Stop()
@@ -881,7 +1185,7 @@ func checkEndpointsCurrentOnce(client *http.Client, cfg Config, jsonOutput bool)
 
 	if len(cfg.EndpointURLs) == 0 {
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(map[string]any{"error": "ENDPOINT_URLS is empty"}))
+			printASCIIJSON(map[string]any{"error": "ENDPOINT_URLS is empty"})
 		} else {
 			fmt.Println("ENDPOINT_URLS is empty")
 		}
@@ -890,7 +1194,7 @@ func checkEndpointsCurrentOnce(client *http.Client, cfg Config, jsonOutput bool)
 
 	if strings.TrimSpace(cfg.ProxyAddr) == "" {
 		if jsonOutput {
-			fmt.Println(mustASCIIJSON(map[string]any{"error": "MIHOMO_PROXY_ADDR is empty"}))
+			printASCIIJSON(map[string]any{"error": "MIHOMO_PROXY_ADDR is empty"})
 		} else {
 			fmt.Println("MIHOMO_PROXY_ADDR is empty")
 		}
@@ -907,12 +1211,12 @@ func checkEndpointsCurrentOnce(client *http.Client, cfg Config, jsonOutput bool)
 	}
 
 	if jsonOutput {
-		fmt.Println(mustASCIIJSON(map[string]any{
+		printASCIIJSON(map[string]any{
 			"current":       current,
 			"current_found": currentFound,
 			"all_reachable": allReachable,
 			"endpoints":     endpointResults,
-		}))
+		})
 		return
 	}
 
@@ -1025,12 +1329,11 @@ func main() {
 		os.Exit(1)
 	}
 
-	baseTransport, err := buildBaseTransportNoEnvProxy()
+	client, err := buildControllerClient(cfg)
 	if err != nil {
 		fmt.Fprintln(os.Stderr, err.Error())
 		os.Exit(1)
 	}
-	client := &http.Client{Transport: baseTransport}
 
 	switch {
 	case args.PrintDelays:
@@ -1040,7 +1343,10 @@ func main() {
 	case args.AutoSelect:
 		autoSelectOnce(client, cfg, args.JSONOutput, args.DryRun)
 	case args.Monitor:
-		monitorLoop(client, cfg, args.JSONOutput, args.DryRun)
+		sigCh := make(chan os.Signal, 1)
+		signal.Notify(sigCh, syscall.SIGINT, syscall.SIGTERM)
+		defer signal.Stop(sigCh)
+		monitorLoop(client, cfg, args.JSONOutput, args.DryRun, sigCh)
 	case args.CheckEndpoints:
 		checkEndpointsCurrentOnce(client, cfg, args.JSONOutput)
 	}
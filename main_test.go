@@ -50,6 +50,27 @@ func TestParseGroupDelaysFilterToggle(t *testing.T) {
 	}
 }
 
+func TestStreamParseGroupDelays(t *testing.T) {
+	raw := []byte(`{"delays":{"香港 01":10,"HK-Edge":11,"US 01":20,"JP 02":-1}}`)
+
+	filtered, ok := streamParseGroupDelays(raw, true)
+	if !ok {
+		t.Fatalf("expected stream parse to handle delays payload")
+	}
+	if len(filtered) != 1 || filtered[0].Name != "US 01" {
+		t.Fatalf("unexpected filtered result: %#v", filtered)
+	}
+
+	unfiltered, ok := streamParseGroupDelays(raw, false)
+	if !ok || len(unfiltered) != 3 {
+		t.Fatalf("unexpected unfiltered result: %#v", unfiltered)
+	}
+
+	if _, ok := streamParseGroupDelays([]byte(`{"US 01":20}`), false); ok {
+		t.Fatalf("expected fallback signal for flat payload shape")
+	}
+}
+
 func TestSanitizeName(t *testing.T) {
 	if got := sanitizeName("A!@#香港-(01)"); got != "A香港-(01)" {
 		t.Fatalf("sanitizeName mismatch: %q", got)
@@ -192,6 +213,62 @@ func TestParseArgsDryRunValidation(t *testing.T) {
 	}
 }
 
+func TestAutoSelectTickUsesCachedCurrent(t *testing.T) {
+	var currentCalls int32
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		switch {
+		case r.Method == http.MethodGet && r.URL.Path == "/proxies/PROXY":
+			atomic.AddInt32(&currentCalls, 1)
+			_ = json.NewEncoder(w).Encode(map[string]any{"now": "A"})
+		case r.Method == http.MethodGet && r.URL.Path == "/group/PROXY/delay":
+			_ = json.NewEncoder(w).Encode(map[string]any{
+				"delays": map[string]any{
+					"A": 100,
+					"B": 200,
+				},
+			})
+		default:
+			http.NotFound(w, r)
+		}
+	}))
+	defer server.Close()
+
+	cfg := Config{
+		ControllerURL:        server.URL,
+		ProxyGroup:           "PROXY",
+		TestURL:              "https://example.com",
+		DelayTimeoutMS:       3000,
+		AutoSelectDiffMS:     100,
+		KeepDelayThresholdMS: 2000,
+		FilterHKNodes:        false,
+	}
+
+	oldStdout := os.Stdout
+	r, w, err := os.Pipe()
+	if err != nil {
+		t.Fatalf("pipe create failed: %v", err)
+	}
+	os.Stdout = w
+
+	state := monitorState{}
+	autoSelectTick(server.Client(), cfg, true, true, &state)
+	autoSelectTick(server.Client(), cfg, true, true, &state)
+	autoSelectTick(server.Client(), cfg, true, true, &state)
+
+	_ = w.Close()
+	os.Stdout = oldStdout
+	_, _ = io.ReadAll(r)
+	_ = r.Close()
+
+	if got := atomic.LoadInt32(&currentCalls); got != 1 {
+		t.Fatalf("expected 1 current-proxy fetch with cached state, got %d", got)
+	}
+	if state.lastKnownCurrent != "A" {
+		t.Fatalf("expected cached current A, got %q", state.lastKnownCurrent)
+	}
+}
+
 func TestAutoSelectDryRunDoesNotSwitch(t *testing.T) {
 	var putCalls int32
 